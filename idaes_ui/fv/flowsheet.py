@@ -261,19 +261,13 @@ class FlowsheetSerializer:
                 # Find unit models nested within indexed blocks
                 type_ = self.get_unit_model_type(component)
                 for item in component.parent_component().values():
-                    if isinstance(item, UnitModelBlockData):
-                        # See if this unit is connected to an arc
-                        is_connected = False
-                        for stream in self.streams.values():
-                            if (
-                                item == stream.source.parent_block()
-                                or item == stream.dest.parent_block()
-                            ):
-                                is_connected = True
-                                break
-                        # Add to diagram if connected
-                        if is_connected:
-                            components[item] = type_
+                    # Add to diagram if connected to an arc, using the set of
+                    # arc endpoints rather than scanning all the arcs
+                    if (
+                        isinstance(item, UnitModelBlockData)
+                        and item in self._known_endpoints
+                    ):
+                        components[item] = type_
 
         return components
 
@@ -288,16 +282,18 @@ class FlowsheetSerializer:
         # but I (Makayla) don't know how that connects to the stream names so this
         # will be left alone for now
         for stream_name, stream_value in stream_states_dict(self.streams).items():
-            label = ""
+            # collect the lines and join once, instead of growing a string
+            lines = []
             for var, var_value in stream_value.define_display_vars().items():
                 var = var.capitalize()
 
                 for k, v in var_value.items():
+                    v_rounded = round(value(v), self._sig_figs)
                     if k is None:
-                        label += f"{var} {round(value(v), self._sig_figs)}\n"
+                        lines.append(f"{var} {v_rounded}\n")
                     else:
-                        label += f"{var} {k} {round(value(v), self._sig_figs)}\n"
-            self.labels[stream_name] = label[:-2]
+                        lines.append(f"{var} {k} {v_rounded}\n")
+            self.labels[stream_name] = "".join(lines)[:-2]
 
     def _map_edges(self):
         # Map the arcs to the ports to construct the edges
@@ -675,12 +671,12 @@ class FlowsheetSerializer:
             src = ports_dict["source"]
             dest = ports_dict["dest"]
 
-            src_unit_name = self.unit_models[src]["name"]
-            src_unit_type = self.unit_models[src]["type"]
+            src_unit, dest_unit = self.unit_models[src], self.unit_models[dest]
+
+            src_unit_name, src_unit_type = src_unit["name"], src_unit["type"]
             src_unit_icon = UnitModelIcon(src_unit_type)
 
-            dest_unit_name = self.unit_models[dest]["name"]
-            dest_unit_type = self.unit_models[dest]["type"]
+            dest_unit_name, dest_unit_type = dest_unit["name"], dest_unit["type"]
             dest_unit_icon = UnitModelIcon(dest_unit_type)
 
             if src_unit_name not in track_jointjs_elements:
@@ -940,8 +936,9 @@ class FlowsheetDiff:
             dict with structure: cell_id -> index. e.g. {'F101': 2} where 2 is
             the cell index in the 'cells' array.
         """
-        for i, cell in enumerate(self._new["cells"]):
-            self._cell_indices[cell["id"]] = i
+        self._cell_indices = {
+            cell["id"]: i for i, cell in enumerate(self._new["cells"])
+        }
 
     def _compute_diff(self) -> Dict:
         diff = {"add": {}, "remove": {}, "change": {}}
@@ -981,35 +978,28 @@ class FlowsheetDiff:
         for cell in self._old["cells"]:
             cell_id = cell["id"]
             if cell_id in self._cell_indices:
+                new_cell = layout[self._cell_indices[cell_id]]
                 # check if cell is an element (not link) and 'position',
                 # 'angle' & 'attrs.label' keys exist in cell
                 if "type" in cell and cell["type"] == "standard.Image":
                     if "position" in cell:
-                        layout[self._cell_indices[cell_id]]["position"] = cell[
-                            "position"
-                        ]
+                        new_cell["position"] = cell["position"]
                     if "angle" in cell:
-                        layout[self._cell_indices[cell_id]]["angle"] = cell["angle"]
+                        new_cell["angle"] = cell["angle"]
                     if "attrs" in cell and "label" in cell["attrs"]:
-                        if "attrs" not in layout[self._cell_indices[cell_id]]:
-                            layout[self._cell_indices[cell_id]]["attrs"] = {}
-                        layout[self._cell_indices[cell_id]]["attrs"]["label"] = cell[
-                            "attrs"
-                        ]["label"]
+                        if "attrs" not in new_cell:
+                            new_cell["attrs"] = {}
+                        new_cell["attrs"]["label"] = cell["attrs"]["label"]
                 # check if link and if it has 'vertices' & 'labels[1]'
                 # keys exist in cell
                 elif "type" in cell and cell["type"] == "standard.Link":
                     if "vertices" in cell:
-                        layout[self._cell_indices[cell_id]]["vertices"] = cell[
-                            "vertices"
-                        ]
+                        new_cell["vertices"] = cell["vertices"]
                     # labels[0] is reserved for the variables info when labels
                     # are enabled in the UI. We are just copying labels[1] as
                     # it has the stream/link name. e.g. s10, s_liq_outlet, etc
                     if "labels" in cell and len(cell["labels"]) >= 2:
-                        layout[self._cell_indices[cell_id]]["labels"][1] = cell[
-                            "labels"
-                        ][1]
+                        new_cell["labels"][1] = cell["labels"][1]
 
         # Update cells' labels or images
         for item in self._old["cells"]:
@@ -222,7 +222,7 @@ def _handle_existing_save_path(name, save_path, max_versions=10, overwrite=None)
     if overwrite:
         if save_path.exists():
             _log.warning(f"Overwriting existing save file '{save_path}'")
-            save_path.open("w")  # blank file
+            save_path.write_text("")  # blank file
         return save_path
     elif not save_path.exists():
         return save_path
@@ -13,6 +13,7 @@
 # TODO: Missing doc strings
 # pylint: disable=missing-module-docstring
 
+import copy
 import os
 import json
 from typing import Dict
@@ -38,14 +39,23 @@ class UnitModelIcon:
             unit_model = default
         self._model = unit_model
 
-        # Loading the Unit Models mappings
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        mappings_file = os.path.join(dir_path, os.pardir, "mappings", "mappings.json")
-        with open(mappings_file, "r") as mappings_f:
-            self._mapping = json.load(mappings_f)
-        self._model_details = self._get_mapping(unit_model, default)
+        self._mapping = self._load_mapping()
+        # copy, since building the link positions modifies the details in place
+        self._model_details = copy.deepcopy(self._get_mapping(unit_model, default))
         self._pos = self._build_link_positions()
 
+    @classmethod
+    def _load_mapping(cls) -> Dict:
+        """Load the Unit Models mappings, reading the file only on first use."""
+        if not cls._mapping:
+            dir_path = os.path.dirname(os.path.realpath(__file__))
+            mappings_file = os.path.join(
+                dir_path, os.pardir, "mappings", "mappings.json"
+            )
+            with open(mappings_file, "r") as mappings_f:
+                cls._mapping = json.load(mappings_f)
+        return cls._mapping
+
     def _get_mapping(self, unit_model, default):
         """Find the correct mapping for the given unit_model name."""
         if unit_model in self._mapping:
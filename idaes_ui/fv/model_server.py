@@ -250,6 +250,9 @@ class FlowsheetServer(http.server.HTTPServer):
 class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
     """Handle requests from the IDAES flowsheet visualization (IFV) web page."""
 
+    #: Contents of the index file, shared by all handlers once read
+    _app_template = None
+
     def __init__(self, *args, **kwargs):
         self.directory = (
             None  # silence warning about initialization outside constructor
@@ -311,12 +314,18 @@ class FlowsheetServerHandler(http.server.SimpleHTTPRequestHandler):
 
     def _get_app(self, id_):
         """Read index file, process to insert flowsheet identifier, and return it."""
-        p = Path(_template_dir / "index.html")
-        with open(p, "r", encoding="utf-8") as fp:
-            s = fp.read()
-            page = s.format(flowsheet_id=id_)
+        page = self._get_app_template().format(flowsheet_id=id_)
         self._write_html(200, page)
 
+    @classmethod
+    def _get_app_template(cls) -> str:
+        """Get contents of the index file, reading it from disk only on first use."""
+        if cls._app_template is None:
+            p = Path(_template_dir / "index.html")
+            with open(p, "r", encoding="utf-8") as fp:
+                cls._app_template = fp.read()
+        return cls._app_template
+
     def _get_fs(self, id_: str):
         """Get updated flowsheet.
 
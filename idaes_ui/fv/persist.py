@@ -111,10 +111,13 @@ class FileDataStore(DataStore):
         try:
             with self._p.open("w") as fp:
                 if isinstance(data, dict):
+                    # serialize to one string and write it once, rather than
+                    # letting json.dump() issue a write per encoded chunk
                     try:
-                        json.dump(data, fp)
+                        s = json.dumps(data)
                     except TypeError as err:
                         raise errors.DatastoreSerializeError(data, err, stream=fp)
+                    fp.write(s)
                 else:
                     _parse_json(data)  # validation
                     fp.write(str(data))